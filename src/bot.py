@@ -1,12 +1,17 @@
 import asyncio
 import logging
 from random import choice
+from types import SimpleNamespace
 from datetime import datetime
 from re import (
     DOTALL,
-    findall
+    Match,
+    compile
+)
+from typing import (
+    List,
+    Optional
 )
-from typing import List
 
 from discord import (
     Bot,
@@ -24,6 +29,9 @@ from discord import (
     ApplicationContext,
     RawReactionActionEvent,
 )
+from discord.abc import GuildChannel
+from discord.errors import NotFound
+from discord.utils import utcnow
 
 from .utils.db import get_database
 from .utils.youtube import YouTube
@@ -31,23 +39,28 @@ from .utils.filter import Filter
 from .utils.color import Colors
 from .utils.emoji import EmojiGroup
 from .utils.bump_timer import BumpTimer
-from .utils.env import (
-    ICODE_GUILD_ID,
-    MONGO_DB_URI
-)
+from .utils.state import BotState
+from .utils.env import settings
 from .utils.constants import (
     ICODIAN_ROLE_ID,
     STAFF_CHANNEL_ID,
-    WELCOME_MESSAGES,
-    FAREWELL_MESSAGES,
+    WELCOME_MESSAGE_PARTS,
+    FAREWELL_MESSAGE_PARTS,
     SELF_ROLES_CHANNEL_ID,
     MAINTENANCE_CHANNEL_ID,
     INTRODUCTION_CHANNEL_ID,
     GENERAL_CHAT_CHANNEL_ID,
     SERVER_RULES_CHANNEL_ID,
     DISBOARD_ID,
+    AVATAR_CACHE_SIZE,
 )
 
+# AEWN: Animated Emojis Without Nitro
+CODEBLOCK_PATTERN = compile(r"(`{1,3}.+?`{1,3})+", flags=DOTALL)
+
+# Matches processed emojis (<a:name:id>) or emoji names (:name:)
+EMOJI_PATTERN = compile(r"<a?:\w+:\d+>|:([\w\-~]+):")
+
 
 class ICodeBot(Bot):
     """
@@ -64,7 +77,10 @@ class ICodeBot(Bot):
         """
 
         super().__init__(description, *args, **options)
-        self.MAINTENANCE_MODE = maintenance
+        self.state = BotState(maintenance=maintenance)
+
+        # Create BumpTimer instance
+        self.bump_timer = BumpTimer()
 
     async def on_ready(self) -> None:
         """
@@ -72,9 +88,17 @@ class ICodeBot(Bot):
         """
         logging.info(msg=f"Logged in as {self.user}")
 
-        # Create EmojiGroup instance
-        logging.info(msg="Initializing EmojiGroup")
-        self.emoji_group = EmojiGroup(self)
+        # Create EmojiGroup instance once, `on_ready` fires again
+        # on reconnects and the group is kept up to date by events
+        if not hasattr(self, "emoji_group"):
+            logging.info(msg="Initializing EmojiGroup")
+            self.emoji_group = EmojiGroup(self)
+
+        # Webhook updates aren't replayed on a new session
+        self.state.webhook_cache.clear()
+
+        # Get `reminder` emoji used by bump reminders
+        self.state.reminder_emoji = self.emoji_group.find_emoji("reminder")
 
         # Create Filter instance
         logging.info(msg="Initializing Filter")
@@ -86,13 +110,9 @@ class ICodeBot(Bot):
 
         # Get database
         logging.info("Getting database")
-        self.db = get_database(MONGO_DB_URI)
-
-        # Create BumpTimer instance
-        logging.info(msg="Initializing BumpTimer")
-        self.bump_timer = BumpTimer()
+        self.db = get_database(settings().MONGO_DB_URI)
 
-        self.ICODE_GUILD = self.get_guild(ICODE_GUILD_ID)
+        self.ICODE_GUILD = self.get_guild(settings().ICODE_GUILD_ID)
         if not self.ICODE_GUILD:
             logging.warning("Couldn't find iCODE")
 
@@ -116,11 +136,16 @@ class ICodeBot(Bot):
             self.dispatch("bump_done", guild_data, int(delay))
 
         # Set maintenance and staff channel
-        self.MAINTENANCE_CHANNEL = self.get_channel(MAINTENANCE_CHANNEL_ID)
+        self.state.maintenance_channel = self.get_channel(
+            MAINTENANCE_CHANNEL_ID
+        )
         self.STAFF_CHANNEL = self.get_channel(STAFF_CHANNEL_ID)
 
+        # Resolve iCODE channels once
+        self._cache_channels()
+
         # Set DND if the bot is running in maintenance mode,
-        if self.MAINTENANCE_MODE:
+        if self.state.maintenance:
             await self.change_presence(
                 status=Status.do_not_disturb,
                 activity=Game(name="| Under Maintenance")
@@ -131,6 +156,30 @@ class ICodeBot(Bot):
             # Set Online (activity)
             await self.change_presence(activity=Game(name="UMF 2022"))
 
+    def _cache_channels(self) -> None:
+        """
+        Resolve the iCODE channels used by events
+        """
+
+        self.state.channels = SimpleNamespace(
+            g_chat=self.get_channel(GENERAL_CHAT_CHANNEL_ID),
+            intro=self.get_channel(INTRODUCTION_CHANNEL_ID),
+            rules=self.get_channel(SERVER_RULES_CHANNEL_ID),
+            roles=self.get_channel(SELF_ROLES_CHANNEL_ID)
+        )
+
+    async def on_guild_channel_delete(self, channel: GuildChannel) -> None:
+        """
+        Called when a guild channel gets deleted
+
+        Args:
+            channel (GuildChannel): The deleted channel
+        """
+
+        # Re-resolve the cached channels if one of them was deleted
+        if channel in vars(self.state.channels).values():
+            self._cache_channels()
+
     async def on_maintenance(self, ctx: ApplicationContext) -> None:
         """
         Called when a member runs a command in maintenance mode
@@ -148,7 +197,8 @@ class ICodeBot(Bot):
             embed=Embed(
                 title=f"Maintenance Break {emoji}",
                 description="iCODE is under maintenance. Commands will work\n"
-                            f"only in the {self.MAINTENANCE_CHANNEL} channel "
+                            "only in the "
+                            f"{self.state.maintenance_channel} channel "
                             "of iCODE server.",
                 color=Colors.GOLD
             ),
@@ -171,6 +221,18 @@ class ICodeBot(Bot):
         """
 
         await self.emoji_group.update_emojis(guild, after)
+        self.state.reminder_emoji = self.emoji_group.find_emoji("reminder")
+
+    async def on_webhooks_update(self, channel: TextChannel) -> None:
+        """
+        Called when a channel's webhooks are created, updated or deleted
+
+        Args:
+            channel (TextChannel): The channel
+        """
+
+        # Drop the cached webhook so it gets fetched again
+        self.state.webhook_cache.pop(channel.id, None)
 
     async def on_raw_reaction_add(
         self,
@@ -273,34 +335,40 @@ class ICodeBot(Bot):
         except (KeyError, TypeError, AssertionError):
             return
 
-        # Send embed with random welcome msg to console channel
-        await channel.send(
-            embed=Embed(
-                description=choice(
-                    WELCOME_MESSAGES
-                ).format(
-                    member.display_name
-                ),
-                color=Colors.GREEN
-            )
+        # Create embed with random welcome msg for console channel
+        prefix, suffix = choice(WELCOME_MESSAGE_PARTS)
+        console_embed = Embed(
+            description=prefix + member.display_name + suffix,
+            color=Colors.GREEN
         )
 
-        if member.guild.id != ICODE_GUILD_ID:
+        if member.guild.id != settings().ICODE_GUILD_ID:
+            await channel.send(embed=console_embed)
             return
 
-        g_chat_channel: TextChannel = self.get_channel(GENERAL_CHAT_CHANNEL_ID)
-        intro_channel: TextChannel = self.get_channel(INTRODUCTION_CHANNEL_ID)
-        rules_channel: TextChannel = self.get_channel(SERVER_RULES_CHANNEL_ID)
-        roles_channel: TextChannel = self.get_channel(SELF_ROLES_CHANNEL_ID)
-
-        # Give iCodian role to member
+        # Get iCodian role
         role: Role = member.guild.get_role(ICODIAN_ROLE_ID)
-        await member.add_roles(role)
 
-        # Send embed to general-chat channel
-        await g_chat_channel.send(
-            content=member.mention,
-            embed=Embed(
+        # Send welcome msg and give iCodian role to member
+        requests = [
+            channel.send(embed=console_embed),
+            member.add_roles(role)
+        ]
+
+        # iCODE channels, None until resolved in `on_ready`
+        channels = self.state.channels
+        g_chat_channel: TextChannel = getattr(channels, "g_chat", None)
+        intro_channel: TextChannel = getattr(channels, "intro", None)
+        rules_channel: TextChannel = getattr(channels, "rules", None)
+        roles_channel: TextChannel = getattr(channels, "roles", None)
+
+        if None in (g_chat_channel, intro_channel,
+                    rules_channel, roles_channel):
+            logging.warning("iCODE channels are not set up")
+
+        # Otherwise send embed to general-chat channel too
+        else:
+            g_chat_embed = Embed(
                 title=f"Welcome to the server {member.display_name}!",
                 description="Glad to have you here. "
                             "Have a look around the server.\n\n"
@@ -308,14 +376,19 @@ class ICodeBot(Bot):
                             f"Read server rules in   {rules_channel.mention}\n"
                             f"Get self roles from     {roles_channel.mention}",
                 color=Colors.GOLD,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             ).set_thumbnail(
                 url=member.display_avatar
             ).set_footer(
                 text=f"{self.user.display_name} Staff",
                 icon_url=self.user.display_avatar
             )
-        )
+            requests.append(
+                g_chat_channel.send(content=member.mention, embed=g_chat_embed)
+            )
+
+        # Run the requests concurrently
+        await asyncio.gather(*requests)
 
     async def on_member_remove(self, member: Member) -> None:
         """
@@ -336,13 +409,10 @@ class ICodeBot(Bot):
             return
 
         # Send embed with random farewell msg to receiver channel
+        prefix, suffix = choice(FAREWELL_MESSAGE_PARTS)
         await channel.send(
             embed=Embed(
-                description=choice(
-                    FAREWELL_MESSAGES
-                ).format(
-                    member.display_name
-                ),
+                description=prefix + member.display_name + suffix,
                 color=Colors.RED
             )
         )
@@ -352,18 +422,46 @@ class ICodeBot(Bot):
         Called when a user bumps the server
 
         Args:
-            channel (TextChannel): The channel to which bump reminder
-                                   will be sent
+            guild_data (dict): Data of the bumped guild
+            delay (int): Seconds after which the reminder will be sent
         """
 
-        # Sleep for `delay` number of seconds
+        # Cancel the pending reminder of the guild, if any
+        handle = self.state.bump_handles.pop(guild_data["guild_id"], None)
+        if handle:
+            handle.cancel()
+
+        # Send the reminder after `delay` number of seconds
         logging.info(f"Setting timer for {delay} second(s)")
 
-        await asyncio.sleep(delay=delay)
+        self.state.bump_handles[guild_data["guild_id"]] = self.loop.call_later(
+            delay, self._fire_bump_reminder, guild_data
+        )
+
+    def _fire_bump_reminder(self, guild_data: dict) -> None:
+        """
+        Called by the event loop when a bump timer completes
+
+        Args:
+            guild_data (dict): Data of the bumped guild
+        """
+
         logging.info("Timer complete")
 
+        self.state.bump_handles.pop(guild_data["guild_id"], None)
+        self.dispatch("bump_reminder", guild_data)
+
+    async def on_bump_reminder(self, guild_data: dict) -> None:
+        """
+        Called when a bump timer completes to send the bump reminder
+
+        Args:
+            guild_data (dict): Data of the bumped guild
+        """
+
         # Get ids
         bumper = None
+        channel = None
         try:
             # Set up receiver channel
             channel = self.get_channel(
@@ -396,16 +494,13 @@ class ICodeBot(Bot):
                 )
                 return
 
-        # Get `reminder` emoji
-        reminder: Emoji = self.emoji_group.get_emoji("reminder")
-
         # Send embed to the receiver channel
         logging.info(f"Sending reminder to {channel} channel")
 
         await channel.send(
             content=f"{bumper.mention if bumper else 'NO ROLE'}",
             embed=Embed(
-                title=f"Bump Reminder {reminder}",
+                title=f"Bump Reminder {self.state.reminder_emoji or ''}",
                 description="Help grow this server. Run `/bump`",
                 color=Colors.GOLD
             )
@@ -441,7 +536,7 @@ class ICodeBot(Bot):
             0,
             Embed(
                 color=Colors.RED,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             ).set_author(
                 name=(f"{message.author.display_name}'s "
                       "message was deleted"),
@@ -476,7 +571,11 @@ class ICodeBot(Bot):
 
         # Update bump timer
         if message.author.id == DISBOARD_ID:
-            if "Bump done" in message.embeds[0].description:
+            # Guard against messages without embeds or description
+            description = (
+                message.embeds[0].description if message.embeds else None
+            )
+            if description and description.startswith("Bump done"):
                 logging.info("Updating bump time")
 
                 try:
@@ -503,7 +602,11 @@ class ICodeBot(Bot):
             return
 
         # AEWN: Animated Emojis Without Nitro
-        if message.content.count(":") > 1 and not message.webhook_id:
+        # Skip bots, stop at the second colon instead of counting all
+        content = message.content
+        if (not message.author.bot
+                and not message.webhook_id
+                and content.find(":", content.find(":") + 1) > 0):
             await self._animated_emojis(message)
 
         # Check for profanity words
@@ -522,26 +625,18 @@ class ICodeBot(Bot):
             message (Message): Message with emojis
         """
 
-        emoji = None
-        processedCount = 0
-
         # Return if under maintenance
-        if (self.MAINTENANCE_MODE and
-                message.channel != self.MAINTENANCE_CHANNEL):
+        if (self.state.maintenance and
+                message.channel != self.state.maintenance_channel):
             return
 
-        # Insert space between two :: and ><
-        msg = message.content
-        while "::" in msg:
-            msg = msg.replace("::", ": :")
-
-        while "><" in msg:
-            msg = msg.replace("><", "> <")
+        # Return for DMs, emojis are looked up by guild
+        if message.guild is None:
+            return
 
         # Remove codeblocks from message
-        codeblocks: set = set(
-            findall(r"(`{1,3}.+?`{1,3})+", msg, flags=DOTALL)
-        )
+        msg = message.content
+        codeblocks: set = set(CODEBLOCK_PATTERN.findall(msg))
 
         BLOCK_ID_FORMAT = "<CodeBlock => @Index: {}>"
         for idx, block in enumerate(codeblocks):
@@ -550,45 +645,26 @@ class ICodeBot(Bot):
 
             msg = msg.replace(block, BLOCK_ID_FORMAT.format(idx))
 
-        # Search for emojis
-        emojis: set = set(findall(r"(:[\w\-~]*:)+", msg))
-        processed_emojis: dict = {
-            f":{emoji.split(':')[1]}:": True
-            for emoji in findall(r"(<a?:\w+:\d+>)+", msg)
-        }
+        def replace(match: Match) -> str:
+            # Leave processed emojis untouched
+            if not match.group(1):
+                return match.group()
 
-        # Return if all emojis are already processed
-        if len(emojis) - len(processed_emojis) == 0:
-            return
-
-        for word in emojis:
-            # Skip if already processed
-            if word in processed_emojis:
-                continue
-
-            try:
-                # Get emoji
-                emoji = self.emoji_group.get_emoji(
-                    word[1:-1],
-                    message.guild.id
-                )
-
-                # Skip if not a valid emoji
-                if not emoji:
-                    continue
-
-                # Replace the word by its emoji
-                msg = msg.replace(word, str(emoji))
-                processedCount += 1
+            # Replace the word by its emoji if it's a valid one
+            emoji = self.emoji_group.find_emoji(
+                match.group(1), message.guild.id
+            )
+            return str(emoji) if emoji else match.group()
 
-            # Don't do anything if emoji was not found
-            except AttributeError as e:
-                logging.error(e)
+        # Replace all the emojis in a single pass
+        new_msg = EMOJI_PATTERN.sub(replace, msg)
 
         # Return for no emoji
-        if processedCount == 0:
+        if new_msg == msg:
             return
 
+        msg = new_msg
+
         # Add codeblocks back to the message
         for idx, block in enumerate(codeblocks):
             msg = msg.replace(BLOCK_ID_FORMAT.format(idx), block)
@@ -606,30 +682,86 @@ class ICodeBot(Bot):
         Args:
             message (Message): Message of a user
         """
+        # Use the cached webhook, fetch it on a miss
+        webhook = self.state.webhook_cache.get(message.channel.id)
+        if not webhook:
+            webhook = await self._get_webhook(message)
+            self.state.webhook_cache[message.channel.id] = webhook
+
+        # Send webhook to the channel with username as the name
+        # of msg author and avatar as msg author's avatar
+        content = mod_msg if mod_msg else message.content
+        try:
+            await webhook.send(content=content,
+                               username=message.author.display_name,
+                               avatar_url=message.author.display_avatar)
+
+        # The cached webhook was deleted, fetch it again and retry once
+        except NotFound:
+            webhook = await self._get_webhook(message)
+            self.state.webhook_cache[message.channel.id] = webhook
+
+            await webhook.send(content=content,
+                               username=message.author.display_name,
+                               avatar_url=message.author.display_avatar)
+
+    async def _get_webhook(self, message: Message) -> Webhook:
+        """
+        Get the bot's webhook for the msg channel, creating it if needed
+
+        Args:
+            message (Message): Message of a user
+
+        Returns:
+            Webhook: Bot-owned webhook of the channel
+        """
         # Get all webhooks currently in the msg channel
         webhooks = await message.channel.webhooks()
 
-        # Check if there exists a webhook with id
-        # equal to bot's id. In that case, break
-        webhook: Webhook
-        for webhook in webhooks:
-            if webhook.user.id == self.user.id:
-                break
+        # Find the webhook with user id equal to bot's id.
+        # Webhooks whose creator was deleted have no user
+        webhook: Optional[Webhook] = next(
+            (webhook for webhook in webhooks
+             if webhook.user and webhook.user.id == self.user.id),
+            None
+        )
 
         # Otherwise
-        else:
+        if webhook is None:
             # Get msg author's avatar
-            avatar: bytes = await message.author.display_avatar.read()
+            avatar: bytes = await self._get_avatar(message.author)
 
             # and create a new webhook for the channel
-            webhook: Webhook = await message.channel.create_webhook(
+            webhook = await message.channel.create_webhook(
                 name="iCODE-BOT",
                 avatar=avatar,
                 reason="Animated Emoji Usage"
             )
 
-        # Send webhook to the channel with username as the name
-        # of msg author and avatar as msg author's avatar
-        await webhook.send(content=mod_msg if mod_msg else message.content,
-                           username=message.author.display_name,
-                           avatar_url=message.author.display_avatar)
+        return webhook
+
+    async def _get_avatar(self, member: Member) -> bytes:
+        """
+        Get the avatar of a member, reading it only on a cache miss
+
+        Args:
+            member (Member): The member
+
+        Returns:
+            bytes: Avatar of the member
+        """
+        key = (member.id, member.display_avatar.key)
+
+        # Mark the avatar as recently used
+        if key in self.state.avatar_cache:
+            self.state.avatar_cache.move_to_end(key)
+            return self.state.avatar_cache[key]
+
+        avatar = await member.display_avatar.read()
+        self.state.avatar_cache[key] = avatar
+
+        # Evict the least recently used avatar
+        if len(self.state.avatar_cache) > AVATAR_CACHE_SIZE:
+            self.state.avatar_cache.popitem(last=False)
+
+        return avatar
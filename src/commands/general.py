@@ -1,7 +1,4 @@
 import logging
-from datetime import (
-    datetime,
-)
 from typing import List
 
 from discord import (
@@ -17,6 +14,7 @@ from discord import (
     TextChannel,
     InputTextStyle
 )
+from discord.utils import utcnow
 from discord.ext.commands import (
     Cog,
     slash_command
@@ -82,7 +80,7 @@ class EmbedBuilder(Modal):
             title=self.children[0].value,
             description=self.children[1].value,
             color=Colors.GOLD,
-            timestamp=datetime.now()
+            timestamp=utcnow()
         )
 
         # Set thumbnail if provided
@@ -232,7 +230,7 @@ class GeneralCommands(Cog):
         guilds.insert(0, ctx.guild_id)
 
         # Create a list of available emojis
-        temp = []
+        temp = set()
         emojis: List[str] = []
 
         for guild_id in guilds:
@@ -250,7 +248,7 @@ class GeneralCommands(Cog):
                 )
 
                 # Update temp
-                temp.append(emoji)
+                temp.add(emoji)
 
         # To prevent IndexeError
         emoji_count = len(emojis)
@@ -263,7 +261,7 @@ class GeneralCommands(Cog):
         for i in range(0, len(emojis), 20):
             embed = Embed(
                 color=Colors.GOLD,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             ).set_author(
                 name=f"Reflect - Emojis",
                 icon_url=self._bot.user.avatar
@@ -345,7 +343,7 @@ class GeneralCommands(Cog):
             embed=Embed(
                 description=f"**{suggestion}**\n___",
                 color=Colors.GOLD,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             ).set_footer(
                 text=ctx.author.display_name,
                 icon_url=ctx.author.display_avatar
@@ -392,7 +390,7 @@ class GeneralCommands(Cog):
         card = Embed(
             description=guild.description,
             color=Colors.GOLD,
-            timestamp=datetime.now()
+            timestamp=utcnow()
         ).set_footer(
             text=ctx.author.display_name,
             icon_url=ctx.author.display_avatar
@@ -495,7 +493,7 @@ class GeneralCommands(Cog):
         await ctx.respond(
             embed=Embed(
                 color=ctx.author.color,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             ).set_image(
                 url=ctx.guild.icon
             ).set_author(
@@ -542,7 +540,7 @@ class GeneralCommands(Cog):
         # Create user card
         card = Embed(
             color=user.color,
-            timestamp=datetime.now()
+            timestamp=utcnow()
         ).set_footer(
             text=ctx.author.display_name,
             icon_url=ctx.author.display_avatar
@@ -635,7 +633,7 @@ class GeneralCommands(Cog):
         await ctx.respond(
             embed=Embed(
                 color=user.color,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             ).set_image(
                 url=user.display_avatar
             ).set_author(
@@ -674,7 +672,7 @@ class GeneralCommands(Cog):
         await ctx.respond(
             embed=Embed(
                 color=ctx.author.color,
-                timestamp=datetime.now()
+                timestamp=utcnow()
             ).set_footer(
                 text=ctx.author.display_name,
                 icon_url=ctx.author.display_avatar
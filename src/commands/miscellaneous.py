@@ -52,7 +52,7 @@ class MiscellaneousCommands(Cog):
 
         # Respond with an embed and toggle maintenance mode
         emoji = self._bot.emoji_group.get_emoji("loading_dots")
-        if self._bot.MAINTENANCE_MODE:
+        if self._bot.state.maintenance:
             res: Interaction = await ctx.respond(
                 embed=Embed(
                     description=f"Disabling maintenance mode {emoji}",
@@ -78,7 +78,7 @@ class MiscellaneousCommands(Cog):
             )
 
         # Toggle maintenance mode
-        self._bot.MAINTENANCE_MODE = not self._bot.MAINTENANCE_MODE
+        self._bot.state.maintenance = not self._bot.state.maintenance
         await asyncio.sleep(1)
 
         # Prompt completion
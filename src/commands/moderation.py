@@ -18,6 +18,7 @@ from discord.ext.commands import (
     slash_command
 )
 from discord.errors import Forbidden
+from discord.utils import utcnow
 
 from ..bot import ICodeBot
 from ..utils.color import Colors
@@ -167,7 +168,7 @@ class ModerationCommands(Cog):
             description=f"{member.mention} was kicked out by "
                         f"{ctx.author.mention}",
             color=Colors.RED,
-            timestamp=datetime.now()
+            timestamp=utcnow()
         ).add_field(
             name="Reason",
             value=f"{reason if reason else 'No reason provided.'}"
@@ -244,7 +245,7 @@ class ModerationCommands(Cog):
             description=f"{member.mention} was banned by "
                         f"{ctx.author.mention}",
             color=Colors.RED,
-            timestamp=datetime.now()
+            timestamp=utcnow()
         ).add_field(
             name="Reason",
             value=f"{reason if reason else 'No reason provided.'}"
@@ -337,7 +338,7 @@ class ModerationCommands(Cog):
             description=f"{member.mention} was timed out by "
                         f"{ctx.author.mention}",
             color=Colors.RED,
-            timestamp=datetime.now()
+            timestamp=utcnow()
         ).add_field(
             name="Reason",
             value=f"{reason if reason else 'No reason provided.'}"
@@ -1,5 +1,7 @@
-from datetime import (
-    datetime,
+from typing import (
+    Dict,
+    List,
+    Tuple
 )
 
 from discord import (
@@ -9,6 +11,7 @@ from discord import (
     SelectOption,
     ApplicationContext
 )
+from discord.utils import utcnow
 from discord.ui import (
     View,
     select
@@ -36,6 +39,9 @@ class Help(Cog):
         super().__init__()
         self._bot = bot
 
+        # Embed fields of each command group, built on first use
+        self._usage_fields: Dict[str, List[Tuple[str, str]]] = {}
+
     @slash_command(name="help")
     async def _help(self, ctx: ApplicationContext) -> None:
         """
@@ -52,7 +58,7 @@ class Help(Cog):
                         "Choose a command group from the "
                         "below select menu to get help",
             color=ctx.author.color,
-            timestamp=datetime.now()
+            timestamp=utcnow()
         ).set_author(
             name="iCODE Usage Help",
             icon_url=self._bot.user.display_avatar
@@ -66,25 +72,69 @@ class Help(Cog):
         # Send embed with a view obj
         await ctx.respond(
             embed=embed,
-            view=UsageView(self._bot, ctx)
+            view=UsageView(self._bot, ctx, self._usage_fields)
         )
 
 
 class UsageView(View):
 
-    def __init__(self, bot: ICodeBot, ctx: ApplicationContext):
+    def __init__(
+        self,
+        bot: ICodeBot,
+        ctx: ApplicationContext,
+        usage_fields: Dict[str, List[Tuple[str, str]]]
+    ):
         """
         Initialize
 
         Args:
             bot (ICodeBot)
             ctx (ApplicationContext)
+            usage_fields (Dict[str, List[Tuple[str, str]]]): Cache of
+                embed fields shared by all the views
         """
         super().__init__(timeout=360)
 
         # Set attributes for View Obj
         self._bot = bot
         self.ctx = ctx
+        self._usage_fields = usage_fields
+
+    def _get_usage_fields(self, cog_name: str) -> List[Tuple[str, str]]:
+        """
+        Get the (name, value) embed fields of a command group
+
+        Args:
+            cog_name (str): Name of the command group
+
+        Returns:
+            List[Tuple[str, str]]: Embed fields
+        """
+
+        # Commands don't change while the bot is running,
+        # so generate the syntax only once per group
+        if cog_name in self._usage_fields:
+            return self._usage_fields[cog_name]
+
+        cog = self._bot.get_cog(cog_name)
+        emoji = self._bot.emoji_group.get_emoji("reply")
+
+        fields = []
+        for cmd in cog.get_commands():
+            # Create a string of options
+            options = " ".join(
+                [f"<{option.name}>" if option.required else f"[{option.name}]"
+                 for option in cmd.options]
+            )
+
+            fields.append((
+                f"__/{cmd}__",
+                f"{emoji} {cmd.description}\n"
+                f"{emoji} Usage: `/{cmd} {options}`"
+            ))
+
+        self._usage_fields[cog_name] = fields
+        return fields
 
     # Create select menu for command groups
     @select(
@@ -139,22 +189,9 @@ class UsageView(View):
             url=self._bot.user.display_avatar
         )
 
-        # Generate command syntax
-        emoji = self._bot.emoji_group.get_emoji("reply")
-        for cmd in cog.get_commands():
-            # Create a string of options
-            options = " ".join(
-                [f"<{option.name}>" if option.required else f"[{option.name}]"
-                 for option in cmd.options]
-            )
-
-            # Add field to the embed
-            embed.add_field(
-                name=f"__/{cmd}__",
-                value=f"{emoji} {cmd.description}\n"
-                f"{emoji} Usage: `/{cmd} {options}`",
-                inline=False
-            )
+        # Add command syntax to the embed
+        for name, value in self._get_usage_fields(select.values[0]):
+            embed.add_field(name=name, value=value, inline=False)
 
         # Respond to the interaction
         await interaction.response.edit_message(
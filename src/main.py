@@ -11,9 +11,7 @@ from .commands.general import GeneralCommands
 from .commands.moderation import ModerationCommands
 from .commands.miscellaneous import MiscellaneousCommands
 from .commands.reaction_roles import ReactionRoleCommands
-from .utils.env import (
-    BOT_TOKEN
-)
+from .utils.env import settings
 
 
 def main() -> None:
@@ -48,4 +46,4 @@ def main() -> None:
     BOT.add_cog(ReactionRoleCommands(BOT))
 
     # Run
-    BOT.run(BOT_TOKEN)
+    BOT.run(settings().BOT_TOKEN)
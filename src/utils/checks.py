@@ -22,8 +22,8 @@ def under_maintenance(ctx: ApplicationContext) -> bool:
 
     # If the bot is running under maintenance mode
     # and the channel is not the maintenance channel
-    if (ctx.bot.MAINTENANCE_MODE
-            and ctx.channel != ctx.bot.MAINTENANCE_CHANNEL):
+    if (ctx.bot.state.maintenance
+            and ctx.channel != ctx.bot.state.maintenance_channel):
 
         # Dispatch maintenance event
         ctx.bot.dispatch("maintenance", ctx)
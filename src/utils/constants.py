@@ -16,6 +16,12 @@ FAREWELL_MESSAGES = ["Goodbye **{}**. We will miss you!",
                      "**{}** left the server.",
                      "Bye **{}**. Sorry to see you go."]
 
+# (prefix, suffix) pairs around the member name
+WELCOME_MESSAGE_PARTS = [msg.partition("{}")[::2] for msg in WELCOME_MESSAGES]
+FAREWELL_MESSAGE_PARTS = [
+    msg.partition("{}")[::2] for msg in FAREWELL_MESSAGES
+]
+
 # Channel IDs
 STAFF_CHANNEL_ID = 923530415124402227
 CONSOLE_CHANNEL_ID = 923523227098152963
@@ -34,3 +40,6 @@ ICODIAN_ROLE_ID = 956176391735496764
 
 # User IDs
 DISBOARD_ID = 302050872383242240
+
+# Caches
+AVATAR_CACHE_SIZE = 32
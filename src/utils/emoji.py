@@ -1,7 +1,9 @@
 from collections import OrderedDict
+from typing import Dict, Optional
+
 from discord import Emoji, Bot, Guild
 
-from .env import ICODE_GUILD_ID
+from .env import settings
 
 
 class EmojiGroup:
@@ -20,6 +22,10 @@ class EmojiGroup:
         self._bot = bot
         self._emojis = OrderedDict()
 
+        # Name -> Emoji index for constant time lookups.
+        # The first guild to register a name owns it
+        self._by_name: Dict[str, Emoji] = {}
+
         # Iterate through the server emojis
         temp = {}
         emoji: Emoji
@@ -41,12 +47,20 @@ class EmojiGroup:
 
                 if not original.get(original_alias):
                     original[original_alias] = original[emoji.name]
+                    self._by_name.setdefault(
+                        original_alias, self._by_name.get(emoji.name)
+                    )
 
                 self._emojis[guild_id][emoji.name] = emoji.id
 
             self._emojis[guild_id][alias] = emoji.id
+            self._by_name.setdefault(alias, emoji)
 
-    def get_emoji(self, name: str, guild_id: int = ICODE_GUILD_ID) -> Emoji:
+    def get_emoji(
+        self,
+        name: str,
+        guild_id: Optional[int] = None
+    ) -> Emoji:
         """
         Get emojis
 
@@ -57,32 +71,56 @@ class EmojiGroup:
             Emoji: emoji for which emoji.name = name
         """
 
-        if guild_id in self._emojis and name in self._emojis[guild_id]:
-            return self._bot.get_emoji(self._emojis[guild_id][name])
+        emoji = self.find_emoji(name, guild_id)
 
         # Raise AttributeError if name does not exist
-        res = list(filter(
-            lambda emojis: name in emojis, self._emojis.values()
-        ))
-
-        if not res:
+        if not emoji:
             raise AttributeError(
                 f"Object of type EmojiGroup has no attribute {name}"
             )
 
-        # Otherwise return the emoji id
-        return self._bot.get_emoji(res[0][name])
+        # Otherwise return the emoji
+        return emoji
+
+    def find_emoji(
+        self,
+        name: str,
+        guild_id: Optional[int] = None
+    ) -> Optional[Emoji]:
+        """
+        Find an emoji without raising
+
+        Args:
+            `name` (str): Name of the emoji
+            `guild_id` (int, optional): Guild whose emojis take precedence.
+                                        Defaults to iCODE.
+
+        Returns:
+            Optional[Emoji]: emoji for which emoji.name = name, else None
+        """
+
+        if guild_id is None:
+            guild_id = settings().ICODE_GUILD_ID
+
+        # Prefer the guild's own emoji
+        guild_emojis = self._emojis.get(guild_id)
+        if guild_emojis and name in guild_emojis:
+            return self._bot.get_emoji(guild_emojis[name])
+
+        return self._by_name.get(name)
 
     async def update_emojis(self, guild: Guild, updated_emojis=None) -> None:
         """
         Update client emojis
         """
 
-        if updated_emojis:
+        if updated_emojis is not None:
             self.__init__(self._bot)
             return
 
         self._emojis[guild.id] = await guild.fetch_emojis()
+        for emoji in self._emojis[guild.id]:
+            self._by_name.setdefault(emoji.name, emoji)
 
     def __repr__(self) -> str:
         """
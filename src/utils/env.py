@@ -1,19 +1,56 @@
 import os
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
 from dotenv import load_dotenv
 
-# Load .env
-load_dotenv(".env")
 
-# ENV CONSTANTS
-ICODE_GUILD_ID = int(os.getenv("ICODE_GUILD_ID"))
-BOT_TOKEN = os.getenv("BOT_TOKEN")
-MONGO_DB_URI = os.getenv("MONGO_DB_URI")
-YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
+@dataclass(frozen=True)
+class Settings:
+    """
+    ENV CONSTANTS
+    """
 
-try:
-    assert ICODE_GUILD_ID is not None
-    assert BOT_TOKEN is not None
-except AssertionError:
-    logging.log(level=logging.ERROR, msg="Missing .env file")
+    ICODE_GUILD_ID: int
+    BOT_TOKEN: str
+    MONGO_DB_URI: Optional[str]
+    YOUTUBE_API_KEY: Optional[str]
+
+
+@lru_cache(maxsize=None)
+def settings() -> Settings:
+    """
+    Load .env once and read the env constants
+
+    Raises:
+        KeyError: If a required constant is missing
+        ValueError: If ICODE_GUILD_ID is not an integer
+
+    Returns:
+        Settings: Env constants
+    """
+
+    # Load .env
+    load_dotenv(".env")
+
+    try:
+        guild_id = os.environ["ICODE_GUILD_ID"]
+        bot_token = os.environ["BOT_TOKEN"]
+    except KeyError as e:
+        logging.error(f"Missing {e.args[0]} in .env file")
+        raise
+
+    try:
+        guild_id = int(guild_id)
+    except ValueError:
+        logging.error(f"ICODE_GUILD_ID must be an integer, got {guild_id!r}")
+        raise
+
+    return Settings(
+        ICODE_GUILD_ID=guild_id,
+        BOT_TOKEN=bot_token,
+        MONGO_DB_URI=os.getenv("MONGO_DB_URI"),
+        YOUTUBE_API_KEY=os.getenv("YOUTUBE_API_KEY")
+    )
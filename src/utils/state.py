@@ -0,0 +1,35 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, Optional, Tuple
+
+from discord import Emoji, TextChannel, Webhook
+
+
+@dataclass(slots=True)
+class BotState:
+    """
+    Runtime state of the bot
+    """
+
+    # Maintenance mode
+    maintenance: bool = False
+    maintenance_channel: Optional[TextChannel] = None
+
+    # iCODE channels, resolved in `on_ready`
+    channels: SimpleNamespace = field(default_factory=SimpleNamespace)
+
+    # `reminder` emoji used by bump reminders
+    reminder_emoji: Optional[Emoji] = None
+
+    # Bot-owned webhooks, keyed by channel id
+    webhook_cache: Dict[int, Webhook] = field(default_factory=dict)
+
+    # Recently read avatars, keyed by (user id, avatar key)
+    avatar_cache: "OrderedDict[Tuple[int, str], bytes]" = field(
+        default_factory=OrderedDict
+    )
+
+    # Pending bump reminders, keyed by guild id
+    bump_handles: Dict[int, asyncio.TimerHandle] = field(default_factory=dict)
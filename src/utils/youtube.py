@@ -1,7 +1,7 @@
 from typing import Any
 from googleapiclient.discovery import build
 
-from .env import YOUTUBE_API_KEY
+from .env import settings
 
 
 class YouTube:
@@ -21,7 +21,7 @@ class YouTube:
         self._yt = build(
             serviceName="youtube",
             version="v3",
-            developerKey=YOUTUBE_API_KEY
+            developerKey=settings().YOUTUBE_API_KEY
         )
 
     def search(self, query: str) -> Any: